@@ -1,8 +1,12 @@
 """Streamlit application for OCR system with PaddleOCR."""
 
+import hashlib
 import os
-import json
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+import orjson
 import streamlit as st
 import pandas as pd
 from ocr.engine import OCREngine
@@ -19,6 +23,57 @@ st.set_page_config(
 OUTPUT_DIR = Path("outputs")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
+# Content-addressed cache so re-uploading the same file skips OCR entirely
+CACHE_DIR = OUTPUT_DIR / "cache"
+CACHE_DIR.mkdir(exist_ok=True)
+
+
+def save_upload_to_temp(uploaded_file) -> str:
+    """
+    Stream an uploaded file to a unique temporary file on disk.
+
+    Copies in bounded chunks instead of materializing the whole upload in
+    memory, and uses a unique temp name so concurrent sessions uploading
+    files with the same name cannot collide.
+    """
+    suffix = Path(uploaded_file.name).suffix
+    uploaded_file.seek(0)
+    with tempfile.NamedTemporaryFile(
+        dir=".", prefix="upload_", suffix=suffix, delete=False
+    ) as f:
+        shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)
+    return f.name
+
+
+def file_digest(uploaded_file, classify_orientation: bool = False) -> str:
+    """
+    Return the content hash of an uploaded file, used as cache key.
+
+    Recognition settings that change the output (orientation detection)
+    are mixed into the key so toggling them never serves a stale result.
+    """
+    digest = hashlib.sha1(uploaded_file.getbuffer())
+    if classify_orientation:
+        digest.update(b"classify_orientation")
+    return digest.hexdigest()
+
+
+def load_cached_result(digest: str):
+    """Load a cached OCR result for the given content hash, if present."""
+    cache_path = CACHE_DIR / f"{digest}.json"
+    if cache_path.exists():
+        return orjson.loads(cache_path.read_bytes())
+    return None
+
+
+def store_cached_result(digest: str, result: dict) -> None:
+    """Atomically persist an OCR result under its content hash."""
+    cache_path = CACHE_DIR / f"{digest}.json"
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(result))
+    tmp_path.replace(cache_path)
+
+
 # Sidebar
 with st.sidebar:
     st.title("OCR MVP")
@@ -63,6 +118,13 @@ with tab1:
             key="extract_text",
         )
 
+        classify_orientation = st.checkbox(
+            "Detectar orientacion de la pagina",
+            value=False,
+            help="Activa una pasada extra de deteccion de orientacion; "
+            "solo necesaria si el documento puede estar girado",
+        )
+
         if uploaded_file:
             col1, col2 = st.columns(2)
 
@@ -82,17 +144,44 @@ with tab1:
                     with st.spinner(
                         "Ejecutando OCR... Esto puede tardar unos segundos"
                     ):
-                        # Save uploaded file temporarily
-                        temp_path = f"temp_{uploaded_file.name}"
-                        with open(temp_path, "wb") as f:
-                            f.write(uploaded_file.getbuffer())
+                        temp_path = None
 
                         try:
-                            # Extract text and boxes (handle PDF or image)
-                            if uploaded_file.name.lower().endswith(".pdf"):
-                                result = OCREngine.extract_text_from_pdf(temp_path)
+                            # Reuse cached result if this exact file was
+                            # already processed with the same settings.
+                            # PDFs never run orientation detection, so
+                            # their key stays unflagged.
+                            is_pdf = uploaded_file.name.lower().endswith(".pdf")
+                            digest = file_digest(
+                                uploaded_file,
+                                classify_orientation and not is_pdf,
+                            )
+                            result = load_cached_result(digest)
+
+                            if result is not None:
+                                # Identical bytes may arrive under a new
+                                # name; the cached copy carries the first
+                                # uploader's filename
+                                result["file"] = uploaded_file.name
                             else:
-                                result = OCREngine.extract_text_and_boxes(temp_path)
+                                # Stream uploaded file to a temp file
+                                temp_path = save_upload_to_temp(uploaded_file)
+
+                                # Extract text and boxes (handle PDF or image)
+                                if is_pdf:
+                                    # Rendered PDF pages are upright by
+                                    # construction, so skip orientation
+                                    # detection there
+                                    result = OCREngine.extract_text_from_pdf(temp_path)
+                                else:
+                                    result = OCREngine.extract_text_and_boxes(
+                                        temp_path,
+                                        classify_orientation=classify_orientation,
+                                    )
+
+                                # Report the original filename, not the temp one
+                                result["file"] = uploaded_file.name
+                                store_cached_result(digest, result)
 
                             # Generate markdown and plain text
                             markdown_text = OCREngine.generate_markdown(result)
@@ -105,11 +194,14 @@ with tab1:
                             # Save results to files
                             base_name = os.path.splitext(uploaded_file.name)[0]
 
-                            # Save JSON
+                            # Serialize JSON once; the same bytes are written
+                            # to disk and served by the download button
+                            json_payload = orjson.dumps(
+                                result, option=orjson.OPT_INDENT_2
+                            )
                             json_filename = f"ocr_{base_name}.json"
                             json_path = OUTPUT_DIR / json_filename
-                            with open(json_path, "w", encoding="utf-8") as f:
-                                json.dump(result, f, ensure_ascii=False, indent=2)
+                            json_path.write_bytes(json_payload)
 
                             # Save Markdown
                             md_filename = f"ocr_{base_name}.md"
@@ -147,9 +239,7 @@ with tab1:
                             with col_c:
                                 st.download_button(
                                     label="Descargar JSON",
-                                    data=json.dumps(
-                                        result, ensure_ascii=False, indent=2
-                                    ),
+                                    data=json_payload,
                                     file_name=json_filename,
                                     mime="application/json",
                                     use_container_width=True,
@@ -164,7 +254,7 @@ with tab1:
 
                         finally:
                             # Clean up temp file
-                            if os.path.exists(temp_path):
+                            if temp_path and os.path.exists(temp_path):
                                 os.remove(temp_path)
 
     # Task 2: Visualize Boxes
@@ -180,18 +270,41 @@ with tab1:
         if uploaded_file:
             if st.button("Procesar Imagen", type="primary"):
                 with st.spinner("Procesando imagen..."):
-                    # Save uploaded file temporarily
-                    temp_path = f"temp_{uploaded_file.name}"
-                    with open(temp_path, "wb") as f:
-                        f.write(uploaded_file.getbuffer())
+                    temp_path = None
 
                     try:
                         # Generate output path
                         output_filename = f"boxes_{uploaded_file.name}"
                         output_path = OUTPUT_DIR / output_filename
 
-                        # Visualize boxes
-                        OCREngine.visualize_boxes(temp_path, str(output_path))
+                        # Reuse cached annotated image if this exact file was
+                        # already processed
+                        digest = file_digest(uploaded_file)
+                        cached_image = CACHE_DIR / f"{digest}.png"
+
+                        if cached_image.exists():
+                            png_bytes = cached_image.read_bytes()
+                        else:
+                            # Stream uploaded file to a temp file
+                            temp_path = save_upload_to_temp(uploaded_file)
+
+                            # Reuse the extraction result if this file was
+                            # already OCR'd, and cache it for the extract task
+                            result = load_cached_result(digest)
+                            if result is None:
+                                result = OCREngine.extract_text_and_boxes(temp_path)
+                                result["file"] = uploaded_file.name
+                                store_cached_result(digest, result)
+
+                            # Annotate in memory without re-running OCR; the
+                            # PNG is encoded once and the bytes reused for
+                            # display, download, disk, and the cache
+                            png_bytes = OCREngine.visualize_boxes_bytes(
+                                temp_path, result=result
+                            )
+                            cached_image.write_bytes(png_bytes)
+
+                        output_path.write_bytes(png_bytes)
 
                         # Display images side by side
                         col1, col2 = st.columns(2)
@@ -205,19 +318,18 @@ with tab1:
 
                         with col2:
                             st.image(
-                                str(output_path),
+                                png_bytes,
                                 caption="Con Cajas",
                                 use_container_width=True,
                             )
 
-                        # Download button
-                        with open(output_path, "rb") as f:
-                            st.download_button(
-                                label="Descargar Imagen Anotada",
-                                data=f.read(),
-                                file_name=output_filename,
-                                mime="image/png",
-                            )
+                        # Download button reuses the in-memory bytes
+                        st.download_button(
+                            label="Descargar Imagen Anotada",
+                            data=png_bytes,
+                            file_name=output_filename,
+                            mime="image/png",
+                        )
 
                         st.success("Imagen procesada correctamente.")
 
@@ -226,7 +338,7 @@ with tab1:
 
                     finally:
                         # Clean up temp file
-                        if os.path.exists(temp_path):
+                        if temp_path and os.path.exists(temp_path):
                             os.remove(temp_path)
 
     # Task 3: Multiple Images
@@ -242,81 +354,120 @@ with tab1:
 
         if uploaded_files:
             if st.button("Procesar Todas", type="primary"):
-                results = []
                 progress_bar = st.progress(0)
                 status_text = st.empty()
 
-                for idx, uploaded_file in enumerate(uploaded_files):
-                    status_text.text(
-                        f"Procesado {idx + 1}/{len(uploaded_files)}: {uploaded_file.name}"
-                    )
+                def process_file(uploaded_file) -> tuple[dict, str | None]:
+                    """Run OCR for one upload and persist its outputs.
 
-                    # Save uploaded file temporarily
-                    temp_path = f"temp_{uploaded_file.name}"
-                    with open(temp_path, "wb") as f:
-                        f.write(uploaded_file.getbuffer())
+                    Executed on a worker thread; returns the summary row and
+                    an error message (if any) so all Streamlit calls stay on
+                    the main thread.
+                    """
+                    temp_path = None
 
                     try:
-                        # Extract text and boxes (handle PDF or image)
-                        if uploaded_file.name.lower().endswith(".pdf"):
-                            result = OCREngine.extract_text_from_pdf(temp_path)
+                        # Reuse cached result if this exact file was already
+                        # processed
+                        digest = file_digest(uploaded_file)
+                        result = load_cached_result(digest)
+
+                        if result is not None:
+                            # Identical bytes may arrive under a new name;
+                            # the cached copy carries the first uploader's
+                            # filename
+                            result["file"] = uploaded_file.name
                         else:
-                            result = OCREngine.extract_text_and_boxes(temp_path)
+                            # Stream uploaded file to a temp file
+                            temp_path = save_upload_to_temp(uploaded_file)
 
-                        results.append(
-                            {
-                                "Filename": uploaded_file.name,
-                                "Lines": result["total_lines"],
-                                "Pages": result.get("total_pages", 1),
-                                "Text": (
-                                    result["full_text"][:100] + "..."
-                                    if len(result["full_text"]) > 100
-                                    else result["full_text"]
-                                ),
-                            }
-                        )
+                            # Extract text and boxes (handle PDF or image)
+                            if uploaded_file.name.lower().endswith(".pdf"):
+                                result = OCREngine.extract_text_from_pdf(temp_path)
+                            else:
+                                result = OCREngine.extract_text_and_boxes(temp_path)
+
+                            # Report the original filename, not the temp one
+                            result["file"] = uploaded_file.name
+                            store_cached_result(digest, result)
 
                         # Save individual result
                         base_name = os.path.splitext(uploaded_file.name)[0]
 
                         # Save JSON
-                        json_filename = f"ocr_{base_name}.json"
-                        json_path = OUTPUT_DIR / json_filename
-                        with open(json_path, "w", encoding="utf-8") as f:
-                            json.dump(result, f, ensure_ascii=False, indent=2)
+                        json_path = OUTPUT_DIR / f"ocr_{base_name}.json"
+                        json_path.write_bytes(
+                            orjson.dumps(result, option=orjson.OPT_INDENT_2)
+                        )
 
                         # Save Markdown
                         markdown_text = OCREngine.generate_markdown(result)
-                        md_filename = f"ocr_{base_name}.md"
-                        md_path = OUTPUT_DIR / md_filename
+                        md_path = OUTPUT_DIR / f"ocr_{base_name}.md"
                         with open(md_path, "w", encoding="utf-8") as f:
                             f.write(markdown_text)
 
                         # Save Plain Text
                         plain_text = OCREngine.generate_plain_text(result)
-                        txt_filename = f"ocr_{base_name}.txt"
-                        txt_path = OUTPUT_DIR / txt_filename
+                        txt_path = OUTPUT_DIR / f"ocr_{base_name}.txt"
                         with open(txt_path, "w", encoding="utf-8") as f:
                             f.write(plain_text)
 
+                        return (
+                            {
+                                "Filename": uploaded_file.name,
+                                "Lines": result["total_lines"],
+                                "Pages": result.get("total_pages", 1),
+                                "Text": (
+                                    result["full_text"][:100] + "..."
+                                    if len(result["full_text"]) > 100
+                                    else result["full_text"]
+                                ),
+                            },
+                            None,
+                        )
+
                     except Exception as e:
-                        st.warning(f"Error procesando {uploaded_file.name}: {str(e)}")
-                        results.append(
+                        return (
                             {
                                 "Filename": uploaded_file.name,
                                 "Lines": 0,
                                 "Pages": 0,
                                 "Text": f"Error: {str(e)}",
-                            }
+                            },
+                            f"Error procesando {uploaded_file.name}: {str(e)}",
                         )
 
                     finally:
                         # Clean up temp file
-                        if os.path.exists(temp_path):
+                        if temp_path and os.path.exists(temp_path):
                             os.remove(temp_path)
 
-                    # Update progress
-                    progress_bar.progress((idx + 1) / len(uploaded_files))
+                # Files are independent, so process them concurrently;
+                # progress updates happen here as futures complete
+                rows: dict[int, dict] = {}
+                workers = min(len(uploaded_files), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(process_file, uploaded_file): idx
+                        for idx, uploaded_file in enumerate(uploaded_files)
+                    }
+
+                    for done, future in enumerate(as_completed(futures), start=1):
+                        idx = futures[future]
+                        row, error = future.result()
+                        rows[idx] = row
+
+                        if error:
+                            st.warning(error)
+
+                        status_text.text(
+                            f"Procesado {done}/{len(uploaded_files)}: "
+                            f"{uploaded_files[idx].name}"
+                        )
+                        progress_bar.progress(done / len(uploaded_files))
+
+                # Keep the summary table in upload order
+                results = [rows[idx] for idx in range(len(uploaded_files))]
 
                 status_text.text("Procesamiento completado.")
 
@@ -338,20 +489,19 @@ with tab1:
 with tab2:
     st.header("Resultados Guardados")
 
-    if not any(OUTPUT_DIR.iterdir()):
+    saved_files = [path for path in OUTPUT_DIR.iterdir() if path.is_file()]
+
+    if not saved_files:
         st.info("No hay resultados guardados aun. Procesa algunas imagenes primero.")
     else:
-        # List all files in outputs directory
-        files = sorted(
-            OUTPUT_DIR.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True
-        )
+        # List all files in outputs directory (the cache subdir is internal)
+        files = sorted(saved_files, key=lambda x: x.stat().st_mtime, reverse=True)
 
         for file_path in files:
             with st.expander(f"{file_path.name}"):
                 if file_path.suffix == ".json":
                     # Display JSON files
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+                    data = orjson.loads(file_path.read_bytes())
                     st.json(data)
                 elif file_path.suffix in [".png", ".jpg", ".jpeg", ".webp"]:
                     # Display image files
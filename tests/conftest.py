@@ -8,6 +8,17 @@ import pytest
 from PIL import Image, ImageDraw, ImageFont
 
 
+@pytest.fixture(autouse=True)
+def isolated_ocr_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Point the engine's persistent result cache at a per-test directory.
+
+    Keeps tests from being served results cached under the user's home
+    directory by earlier runs (or earlier code versions).
+    """
+    monkeypatch.setenv("OCR_CACHE_DIR", str(tmp_path / "ocr-cache"))
+
+
 @pytest.fixture
 def sample_image() -> Generator[str, None, None]:
     """
@@ -127,6 +127,122 @@ class TestOCREngineVisualization:
             OCREngine.visualize_boxes(invalid_image_path, str(output_path))
 
 
+class TestOCREngineResultCache:
+    """Tests for the persistent content-hash result cache."""
+
+    def test_cache_store_and_load_round_trip(self) -> None:
+        """Test that a stored result loads back identically."""
+        from ocr.engine import OCREngine
+
+        result = {
+            "file": "sample.png",
+            "full_text": "hola mundo",
+            "boxes": [{"text": "hola", "confidence": 0.95, "bbox": [10, 5, 40, 12]}],
+            "total_lines": 1,
+        }
+        OCREngine._cache_store("0" * 32, result)
+
+        assert OCREngine._cache_load("0" * 32) == result
+
+    def test_cache_load_missing_key_returns_none(self) -> None:
+        """Test that an unknown key is a clean miss."""
+        from ocr.engine import OCREngine
+
+        assert OCREngine._cache_load("f" * 32) is None
+
+    def test_image_cache_key_depends_on_content_and_settings(self) -> None:
+        """Test that pixels and recognition settings both change the key."""
+        import numpy as np
+        from ocr.engine import OCREngine
+
+        image = np.zeros((8, 8), dtype=np.uint8)
+        other = np.full((8, 8), 255, dtype=np.uint8)
+        key = OCREngine._image_cache_key(image, False)
+
+        assert key != OCREngine._image_cache_key(other, False)
+        assert key != OCREngine._image_cache_key(image, True)
+
+
+class TestOCREngineHelpers:
+    """Tests for pure-Python parsing and filtering helpers."""
+
+    def test_is_blank_detects_flat_image(self) -> None:
+        """Test that a uniform image is classified blank."""
+        import numpy as np
+        from ocr.engine import OCREngine
+
+        assert OCREngine._is_blank(np.full((200, 200, 3), 255, dtype=np.uint8))
+
+    def test_is_blank_keeps_sparse_text(self) -> None:
+        """Test that a page with one short text line is not blank."""
+        import numpy as np
+        from ocr.engine import OCREngine
+
+        page = np.full((842, 595), 255, dtype=np.uint8)
+        page[100:130, 72:250] = 0
+
+        assert not OCREngine._is_blank(page)
+
+    def test_parse_word_columns_filters_empty_words(self) -> None:
+        """Test that low-confidence and whitespace words are dropped."""
+        from ocr.engine import OCREngine
+
+        data = {
+            "conf": ["95", "-1", "80", "90"],
+            "text": ["Hola", "", "Mundo", "   "],
+            "left": [10, 0, 60, 0],
+            "top": [5, 0, 5, 0],
+            "width": [40, 0, 45, 0],
+            "height": [12, 0, 12, 0],
+        }
+        columns = OCREngine._parse_word_columns(data)
+
+        assert columns["texts"] == ["Hola", "Mundo"]
+        assert columns["confidences"].tolist() == pytest.approx([0.95, 0.80])
+        assert columns["rects"].tolist() == [[10, 5, 40, 12], [60, 5, 45, 12]]
+
+    def test_rects_to_corners_layout(self) -> None:
+        """Test corner expansion order for a single rect."""
+        import numpy as np
+        from ocr.engine import OCREngine
+
+        rects = np.array([[10, 5, 40, 12]], dtype=np.int32)
+
+        assert OCREngine._rects_to_corners(rects).tolist() == [
+            [[10, 5], [50, 5], [50, 17], [10, 17]]
+        ]
+
+    def test_parse_tsv_builds_dict_layout(self) -> None:
+        """Test that raw TSV output maps onto the DICT column layout."""
+        from ocr.engine import OCREngine
+
+        tsv = "\n".join(
+            [
+                "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num"
+                "\tleft\ttop\twidth\theight\tconf\ttext",
+                "5\t1\t1\t1\t1\t1\t10\t5\t40\t12\t95\tHola",
+                "5\t2\t1\t1\t1\t1\t60\t5\t45\t12\t80\tMundo",
+            ]
+        )
+        data = OCREngine._parse_tsv(tsv)
+
+        assert data["page_num"] == [1, 2]
+        assert data["text"] == ["Hola", "Mundo"]
+        assert data["left"] == [10, 60]
+        assert data["conf"] == [95.0, 80.0]
+
+
+class TestOCREnginePDF:
+    """Tests for PDF extraction error handling."""
+
+    def test_extract_text_from_pdf_missing_file_raises(self) -> None:
+        """Test that a missing PDF propagates the renderer error."""
+        from ocr.engine import OCREngine
+
+        with pytest.raises(RuntimeError):
+            OCREngine.extract_text_from_pdf("/nonexistent/path/document.pdf")
+
+
 class TestOCREngineBoxStructure:
     """Tests for box data structure."""
 
@@ -152,11 +268,25 @@ class TestOCREngineBoxStructure:
             assert 0.0 <= box["confidence"] <= 1.0
 
     def test_box_bbox_is_list(self, sample_image: str) -> None:
-        """Test that bbox is a list of coordinates."""
+        """Test that bbox is a flat [x, y, w, h] list of ints."""
         from ocr.engine import OCREngine
 
         result = OCREngine.extract_text_and_boxes(sample_image)
 
         for box in result["boxes"]:
             assert isinstance(box["bbox"], list)
-            assert len(box["bbox"]) == 4  # Four corner points
+            assert len(box["bbox"]) == 4  # x, y, w, h
+            assert all(isinstance(value, int) for value in box["bbox"])
+            x, y, w, h = box["bbox"]
+            assert w >= 0 and h >= 0
+
+    def test_bbox_corners_expands_xywh(self) -> None:
+        """Test that bbox_corners expands a flat bbox into corner points."""
+        from ocr.engine import OCREngine
+
+        assert OCREngine.bbox_corners([10, 5, 40, 12]) == [
+            [10, 5],
+            [50, 5],
+            [50, 17],
+            [10, 17],
+        ]